@@ -1,7 +1,54 @@
 import google.generativeai as genai
+import asyncio
+import hashlib
 import os
+import threading
+import time
+from collections import OrderedDict
 from dotenv import load_dotenv
 
+load_dotenv()
+
+def _positive_setting(name: str, default: str, cast=float):
+    """
+    Reads a numeric setting from the environment, failing at import with a clear message
+    when it isn't a positive number (0 would divide by zero or deadlock the async calls).
+    """
+    raw = os.getenv(name, default)
+    try:
+        value = cast(raw)
+    except ValueError:
+        value = 0
+    if value <= 0:
+        kind = "integer" if cast is int else "number"
+        raise ValueError(f"{name} must be a positive {kind}, got {raw!r}. Check your .env file.")
+    return value
+
+# Client configuration and model discovery are done once per process (per API key);
+# genai.list_models() is a network round-trip we don't want on every analysis.
+_model_lock = threading.Lock()
+_configured_key = None
+_MODEL_SINGLETON = None
+
+# Requests to Gemini are spaced evenly across this per-minute budget, so a burst of analyses
+# queues locally instead of hitting the quota and failing with 429 (ResourceExhausted).
+_REQUESTS_PER_MINUTE = _positive_setting("GEMINI_REQUESTS_PER_MINUTE", "60")
+_pacer_lock = threading.Lock()
+_next_request_slot = 0.0
+
+# In-memory LRU of summaries keyed by a hash of the log snippets, so re-analyzing
+# the same file skips the Gemini call entirely. Only successful responses are stored.
+_SUMMARY_CACHE_SIZE = 256
+_summary_cache = OrderedDict()
+_summary_cache_lock = threading.Lock()
+
+# Async calls run on one long-lived event loop in a background thread: the model's async
+# client binds to the loop it was first used on, so a fresh asyncio.run() per call won't do.
+_async_loop = None
+
+# Upper bound on Gemini calls in flight at once on that loop, however many analyses are queued
+_concurrency_limit = asyncio.Semaphore(_positive_setting("GEMINI_CONCURRENCY", "8", cast=int))
+
 def _get_suitable_model():
     """
     Finds and returns a suitable GenerativeModel that supports generate_content.
@@ -33,39 +80,95 @@ def _get_suitable_model():
         raise ConnectionError(f"Failed to list or select a suitable Generative AI model: {e}")
 
 
-def generate_log_summary(log_snippets: str) -> str:
+def _configure(api_key: str):
     """
-    Analyzes provided log snippets using Google's Generative AI
-    and returns a plain English summary of errors, warnings,
-    and performance bottlenecks with suggested actions, formatted creatively.
+    Configures the Generative AI client, skipping the call if it is already
+    configured with the same API key. A new key invalidates the cached model.
+    """
+    global _configured_key, _MODEL_SINGLETON
+    with _model_lock:
+        if _configured_key != api_key:
+            genai.configure(api_key=api_key)
+            _configured_key = api_key
+            _MODEL_SINGLETON = None
 
-    Args:
-        log_snippets (str): A string containing relevant error/warning log lines.
+
+def _get_model():
+    """
+    Returns the cached GenerativeModel, selecting and instantiating it on first use.
+    """
+    global _MODEL_SINGLETON
+    with _model_lock:
+        if _MODEL_SINGLETON is None:
+            model_name = _get_suitable_model()
+            _MODEL_SINGLETON = genai.GenerativeModel(model_name)
+            print(f"DEBUG: Using model: {model_name}")
+        return _MODEL_SINGLETON
+
+
+def _reserve_request_slot() -> float:
+    """
+    Claims the next free request slot under the per-minute budget.
 
     Returns:
-        str: A concise, plain English summary and insights from the logs,
-             or an error message if the AI call fails.
+        float: Seconds to wait before sending the request (0 if a slot is free now).
     """
-    load_dotenv()
-    GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+    global _next_request_slot
+    with _pacer_lock:
+        now = time.monotonic()
+        slot = max(now, _next_request_slot)
+        _next_request_slot = slot + 60.0 / _REQUESTS_PER_MINUTE
+        return slot - now
 
-    if not GOOGLE_API_KEY:
-        return "ERROR: GOOGLE_API_KEY is not set in your .env file. Please ensure it's configured."
 
-    try:
-        genai.configure(api_key=GOOGLE_API_KEY)
-    except Exception as e:
-        return f"ERROR: Could not configure Google Generative AI. Check API key format or network: {e}"
+def _snippets_key(log_snippets: str) -> str:
+    """
+    Returns a short, stable cache key for the given log snippets.
+    """
+    return hashlib.blake2b(log_snippets.encode("utf-8"), digest_size=16).hexdigest()
 
-    try:
-        model_name = _get_suitable_model()
-        model = genai.GenerativeModel(model_name)
-        print(f"DEBUG: Using model: {model_name}")
-    except Exception as e:
-        return f"ERROR: Could not initialize Generative Model: {e}"
 
-    # --- MODIFIED PROMPT FOR CREATIVE, POINT-BASED OUTPUT ---
-    prompt = f"""
+def _get_cached_summary(key: str):
+    """
+    Returns the cached summary for the key (marking it recently used), or None.
+    """
+    with _summary_cache_lock:
+        summary = _summary_cache.get(key)
+        if summary is not None:
+            _summary_cache.move_to_end(key)
+        return summary
+
+
+def _store_summary(key: str, summary: str):
+    """
+    Stores a summary in the cache, evicting the least recently used entry when full.
+    """
+    with _summary_cache_lock:
+        _summary_cache[key] = summary
+        _summary_cache.move_to_end(key)
+        while len(_summary_cache) > _SUMMARY_CACHE_SIZE:
+            _summary_cache.popitem(last=False)
+
+
+def submit_async(coro):
+    """
+    Schedules a coroutine on the shared background event loop without waiting for it.
+
+    Returns:
+        concurrent.futures.Future: Resolves to the coroutine's result.
+    """
+    global _async_loop
+    with _model_lock:
+        if _async_loop is None:
+            _async_loop = asyncio.new_event_loop()
+            threading.Thread(target=_async_loop.run_forever, name="gemini-async", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _async_loop)
+
+
+# --- MODIFIED PROMPT FOR CREATIVE, POINT-BASED OUTPUT ---
+# The instructions are identical for every request and come before the variable log content,
+# so the prompt prefix stays stable and can be served from Gemini's implicit context cache.
+_PROMPT_INSTRUCTIONS = """
     You are an AI-powered System Health Monitor and Log Forensics Expert. Your mission is to dissect the provided log data and deliver a crystal-clear, actionable summary. Infuse your analysis with a touch of insight and urgency where needed.
 
     Please provide your analysis in the following structured, creative format, using Markdown for readability. Be concise but comprehensive.
@@ -86,31 +189,172 @@ def generate_log_summary(log_snippets: str) -> str:
     ### 🛠️ Recommended Immediate Actions:
     - Provide a prioritized list of actionable steps for investigation and resolution.
 
+    Repeated log lines have been collapsed: a line prefixed with "[xN]" stands for N similar occurrences (differing only in numbers, IDs or IP addresses), shown by its first occurrence.
+
     ---
     Log Snippets to Analyze:
-    {log_snippets}
+"""
+
+
+def _build_prompt(log_snippets: str) -> str:
+    """
+    Builds the analysis prompt sent to the model for the given log snippets.
+    """
+    return f"""{_PROMPT_INSTRUCTIONS}    {log_snippets}
     ---
     """
 
-    # 5. Make the LLM API Call
+
+def _prepare_request(log_snippets: str):
+    """
+    Runs the checks shared by the sync and async entry points: API key, summary cache,
+    client configuration and model lookup.
+
+    Returns:
+        tuple: (early_result, model, prompt, cache_key). When early_result is not None
+               (a cached summary or an error message) it should be returned as-is.
+    """
+    GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+
+    if not GOOGLE_API_KEY:
+        return "ERROR: GOOGLE_API_KEY is not set in your .env file. Please ensure it's configured.", None, None, None
+
+    cache_key = _snippets_key(log_snippets)
+    cached_summary = _get_cached_summary(cache_key)
+    if cached_summary is not None:
+        return cached_summary, None, None, None
+
+    try:
+        _configure(GOOGLE_API_KEY)
+    except Exception as e:
+        return f"ERROR: Could not configure Google Generative AI. Check API key format or network: {e}", None, None, None
+
+    try:
+        model = _get_model()
+    except Exception as e:
+        return f"ERROR: Could not initialize Generative Model: {e}", None, None, None
+
+    return None, model, _build_prompt(log_snippets), cache_key
+
+
+def _generation_config():
+    """
+    Returns the generation settings used for every analysis request.
+    """
+    return genai.types.GenerationConfig(
+        temperature=0.2, # Lower temperature for more focused, less creative responses
+    )
+
+
+def _summary_from_response(response, cache_key: str) -> str:
+    """
+    Extracts the summary text from a model response and caches it on success.
+    """
+    if response and response.parts:
+        summary = response.text
+    elif response and response.candidates and response.candidates[0].text:
+        summary = response.candidates[0].text
+    else:
+        return "AI response structure not as expected. Could not extract text from the model's response."
+
+    _store_summary(cache_key, summary)
+    return summary
+
+
+def _api_error_message(e: Exception) -> str:
+    """
+    Logs an API failure and returns the user-facing error message for it.
+    """
+    print(f"DEBUG: Error during LLM API call: {e}")
+    return f"An error occurred while calling the Google Generative AI API: {e}. Please check your API key, network connection, and ensure the model is available in your region."
+
+
+def generate_log_summary(log_snippets: str) -> str:
+    """
+    Analyzes provided log snippets using Google's Generative AI
+    and returns a plain English summary of errors, warnings,
+    and performance bottlenecks with suggested actions, formatted creatively.
+
+    Args:
+        log_snippets (str): A string containing relevant error/warning log lines.
+
+    Returns:
+        str: A concise, plain English summary and insights from the logs,
+             or an error message if the AI call fails.
+    """
+    early_result, model, prompt, cache_key = _prepare_request(log_snippets)
+    if early_result is not None:
+        return early_result
+
+    # Make the LLM API Call
     try:
-        response = model.generate_content(
-            prompt,
-            generation_config=genai.types.GenerationConfig(
-                temperature=0.2, # Lower temperature for more focused, less creative responses
-            )
-        )
-
-        if response and response.parts:
-            return response.text
-        elif response and response.candidates and response.candidates[0].text:
-            return response.candidates[0].text
-        else:
-            return "AI response structure not as expected. Could not extract text from the model's response."
+        time.sleep(_reserve_request_slot())
+        response = model.generate_content(prompt, generation_config=_generation_config())
+        return _summary_from_response(response, cache_key)
+    except Exception as e:
+        return _api_error_message(e)
+
+
+def stream_log_summary(log_snippets: str):
+    """
+    Streaming counterpart of generate_log_summary(). Yields the summary as the model
+    generates it, so the UI can start rendering after the first tokens arrive.
+
+    Args:
+        log_snippets (str): A string containing relevant error/warning log lines.
+
+    Yields:
+        str: Successive pieces of the summary. Cached summaries and error messages
+             are yielded as a single piece.
+    """
+    early_result, model, prompt, cache_key = _prepare_request(log_snippets)
+    if early_result is not None:
+        yield early_result
+        return
 
+    chunks = []
+    try:
+        time.sleep(_reserve_request_slot())
+        response = model.generate_content(prompt, stream=True, generation_config=_generation_config())
+        for chunk in response:
+            if chunk.parts:
+                chunks.append(chunk.text)
+                yield chunk.text
     except Exception as e:
-        print(f"DEBUG: Error during LLM API call: {e}")
-        return f"An error occurred while calling the Google Generative AI API: {e}. Please check your API key, network connection, and ensure the model is available in your region."
+        yield _api_error_message(e)
+        return
+
+    if chunks:
+        _store_summary(cache_key, "".join(chunks))
+    else:
+        yield "AI response structure not as expected. Could not extract text from the model's response."
+
+
+async def generate_log_summary_async(log_snippets: str) -> str:
+    """
+    Async counterpart of generate_log_summary(). Awaits the model's async client so
+    several analyses can be in flight at once instead of blocking one after another.
+
+    Args:
+        log_snippets (str): A string containing relevant error/warning log lines.
+
+    Returns:
+        str: The summary, or an error message if the AI call fails.
+    """
+    # Off the loop thread: the first call configures the client and lists models over the network
+    early_result, model, prompt, cache_key = await asyncio.to_thread(_prepare_request, log_snippets)
+    if early_result is not None:
+        return early_result
+
+    try:
+        # Wait for the rate-limit slot before taking a permit, so queued calls don't hold one idle
+        await asyncio.sleep(_reserve_request_slot())
+        async with _concurrency_limit:
+            response = await model.generate_content_async(prompt, generation_config=_generation_config())
+        return _summary_from_response(response, cache_key)
+    except Exception as e:
+        return _api_error_message(e)
+
 
 # --- Example Usage (for local testing of ai_logic.py) ---
 if __name__ == "__main__":
@@ -1,113 +1,346 @@
 import os
-import re
-import base64
+import asyncio
+import concurrent.futures
 import json
+import string
+import threading
+import functools
 from io import StringIO, BytesIO
 import markdown
 import pandas as pd # New import for DataFrame
 from datetime import datetime # New import for datetime parsing
 
-from ai_logic import generate_log_summary
+from ai_logic import generate_log_summary_async, submit_async
 
-def parse_log_data(log_content: str, max_lines_for_llm: int = 200) -> dict:
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    # Arrow-backed strings run str.strip/extract/contains in Arrow's C++ kernels,
+    # whose regex engine is RE2 (linear-time, no backtracking)
+    _LOG_LINE_DTYPE = pd.ArrowDtype(pa.string())
+except ImportError:
+    _LOG_LINE_DTYPE = object # Plain Python strings, matched with the re module
+
+# Regex for common log patterns: YYYY-MM-DD HH:MM:SS,ms [LEVEL] MESSAGE
+# This regex is made more flexible for cases where timestamp/level might be missing or vary.
+# Kept as a string: Arrow's kernels take the pattern text, and re caches its own compilation.
+_LOG_PATTERN = (
+    r"^(?P<timestamp_str>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(?:,\d{3})?)?\s*" # Optional timestamp (YYYY-MM-DD HH:MM:SS,ms)
+    r"(?:\[?(?P<level>INFO|WARN|WARNING|ERROR|DEBUG|CRITICAL|FATAL)\]?)?\s*" # Optional Level (e.g., [ERROR] or ERROR)
+    r"(?P<message>.*)" # The rest is the message
+)
+
+# Variable parts masked out when grouping repeated error/warning lines, applied in order
+_TEMPLATE_MASKS = [
+    (r"\b\d{1,3}(?:\.\d{1,3}){3}\b", "IP"), # IPv4 addresses
+    (r"\b[0-9a-fA-F]{8,}\b", "HEX"), # Hashes, request/trace IDs
+    (r"\d+", "N"), # Any remaining numbers
+]
+
+# Raw lines listed per collapsed "[xN]" line in the download report's appendix
+REPORT_LINES_PER_GROUP = 20
+
+# Severity levels from most to least severe; the order used for the timeline's Y-axis and legend
+SEVERITY_ORDER = ['CRITICAL', 'FATAL', 'ERROR', 'WARN', 'WARNING', 'INFO', 'DEBUG']
+SEVERITY_CATS = pd.CategoricalDtype(SEVERITY_ORDER, ordered=True)
+
+# Standalone page wrapping the HTML version of the downloadable report
+_HTML_REPORT_TEMPLATE = string.Template("""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Log Explanation - ${title}</title>
+    <style>
+        body { font-family: 'Inter', sans-serif; line-height: 1.6; margin: 20px; color: #333; }
+        h1, h2, h3, h4, h5, h6 { font-family: 'Inter', sans-serif; color: #2E86C1; }
+        h2 { border-bottom: 1px solid #eee; padding-bottom: 5px; margin-top: 30px; }
+        pre { background-color: #f4f4f4; padding: 10px; border-radius: 5px; overflow-x: auto; }
+        code { background-color: #f9f9f9; padding: 2px 4px; border-radius: 3px; font-family: monospace; }
+        ul { list-style-type: disc; padding-left: 20px; }
+        ol { padding-left: 20px; }
+        ul li, ol li { margin-bottom: 5px; }
+    </style>
+</head>
+<body>
+    ${body}
+</body>
+</html>
+""")
+
+# Markdown converter built once (extensions loaded a single time) and reset between documents.
+# Instances aren't thread-safe and Streamlit sessions run on separate threads, hence the lock.
+_MARKDOWN = markdown.Markdown(extensions=['fenced_code', 'tables', 'nl2br'])
+_markdown_lock = threading.Lock()
+
+# Above this many timeline rows, routine INFO/DEBUG events are aggregated per minute
+TIMELINE_MAX_POINTS = 5000
+
+
+def _split_lines(log_content: str | bytes) -> pd.Series:
+    """
+    Splits log content into a Series of lines. With pyarrow available, the content is
+    validated as UTF-8 and split inside Arrow, so no Python string is created per line.
+
+    Raises:
+        UnicodeDecodeError: If bytes content is not valid UTF-8.
+    """
+    if _LOG_LINE_DTYPE is object:
+        if isinstance(log_content, bytes):
+            log_content = log_content.decode("utf-8")
+        return pd.Series(log_content.splitlines(), dtype=object)
+
+    content = pa.array([log_content], type=pa.binary() if isinstance(log_content, bytes) else pa.string())
+    try:
+        content = content.cast(pa.string())
+    except pa.ArrowInvalid as e:
+        raise UnicodeDecodeError("utf-8", b"", 0, 1, str(e)) from e
+    lines = pc.split_pattern_regex(content, r"\r\n|\r|\n").flatten()
+    return pd.Series(pd.arrays.ArrowExtensionArray(lines))
+
+
+def _collapse_repeated_lines(alerts: pd.DataFrame, max_lines: int) -> list[tuple[str, int, list[str]]]:
+    """
+    Groups error/warning lines that differ only in numbers, hex IDs or IP addresses
+    (retries, repeated stack frames, per-request errors) and returns one exemplar per group.
+
+    Args:
+        alerts (pd.DataFrame): Error/warning rows with 'level', 'message' and 'raw_line' columns.
+        max_lines (int): Maximum number of groups to return.
+
+    Returns:
+        list[tuple[str, int, list[str]]]: Most frequent groups first, each as its exemplar
+            (the first raw line, prefixed with "[xN]" when the group holds N > 1 lines),
+            N, and the group's first REPORT_LINES_PER_GROUP raw lines in log order.
+    """
+    messages = alerts["message"]
+    for pattern, placeholder in _TEMPLATE_MASKS:
+        messages = messages.str.replace(pattern, placeholder, regex=True)
+    templates = (alerts["level"].astype(str) + " " + messages.astype(str)).to_numpy()
+    grouped = alerts.groupby(templates, sort=False)["raw_line"]
+    groups = grouped.agg(["first", "size"])
+    # Stable sort keeps first-seen order among equally frequent groups
+    groups = groups.sort_values("size", ascending=False, kind="stable").head(max_lines)
+    # Only the head of each group is kept for the report, so a flood of retries doesn't copy every line
+    is_sample = (grouped.cumcount() < REPORT_LINES_PER_GROUP).to_numpy()
+    samples = alerts.loc[is_sample, "raw_line"].groupby(templates[is_sample], sort=False).agg(list)
+    return [
+        (line if count == 1 else f"[x{count}] {line}", count, samples[template])
+        for template, line, count in zip(groups.index, groups["first"], groups["size"])
+    ]
+
+
+class ParsedLogs:
+    """
+    Result of parse_log_data(). The error/warning lines needed for the LLM are computed
+    up front; the DataFrame used for plotting is only finished (timestamp parsing) the first
+    time df_logs is accessed, so LLM-only callers never pay for it.
+
+    Attributes:
+        llm_log_lines (list[str]): Error/warning lines for the LLM, with near-duplicates
+            collapsed into one "[xN]"-prefixed exemplar each.
+        line_groups (list[tuple[str, int, list[str]]]): For each of llm_log_lines: the line,
+            the number of raw lines it stands for, and the first of those raw lines.
+    """
+
+    def __init__(self, entries: pd.DataFrame, line_groups: list[tuple[str, int, list[str]]]):
+        self._entries = entries
+        self.line_groups = line_groups
+        self.llm_log_lines = [line for line, _, _ in line_groups]
+
+    @functools.cached_property
+    def df_logs(self) -> pd.DataFrame:
+        """
+        Pandas DataFrame with parsed log entries (timestamp_str, level, message, raw_line, timestamp).
+        """
+        df_logs = self._entries
+
+        # Convert timestamp strings to datetime objects, handling potential missing timestamps
+        if 'timestamp_str' in df_logs.columns and not df_logs['timestamp_str'].isnull().all():
+            # Single pass for both "HH:MM:SS,ms" and "HH:MM:SS": with the comma swapped for a dot,
+            # ISO8601 parsing accepts the optional fraction. cache=True parses repeated timestamps once.
+            df_logs['timestamp'] = pd.to_datetime(
+                df_logs['timestamp_str'].str.replace(',', '.', regex=False), errors='coerce', format='ISO8601', cache=True
+            )
+        else:
+            df_logs['timestamp'] = pd.NaT # Add a NaT column if no timestamps found at all
+
+        return df_logs
+
+
+def parse_log_data(log_content: str | bytes, max_lines_for_llm: int = 200) -> ParsedLogs:
     """
     Parses log content to extract detailed event information (timestamp, level, message)
     into a Pandas DataFrame, and also collects raw error/warning lines for the LLM.
 
     Args:
-        log_content (str): The full content of the log file as a string.
+        log_content (str | bytes): The full content of the log file, as a string or UTF-8 bytes.
+        max_lines_for_llm (int): Maximum number of log lines to send to the LLM.
+
+    Returns:
+        ParsedLogs: The error/warning lines, plus the parsed entries as a lazily built DataFrame.
+    """
+    # Strip every line and drop blanks up front; the remaining columns are derived from raw_line
+    lines = _split_lines(log_content).str.strip()
+    lines = lines[lines != ""].reset_index(drop=True)
+
+    # One vectorized regex sweep over all lines instead of a per-line match loop
+    df_logs = lines.str.extract(_LOG_PATTERN)
+    # Arrow's extract yields "" rather than NA for optional groups that didn't participate
+    df_logs[["timestamp_str", "level"]] = df_logs[["timestamp_str", "level"]].replace("", pd.NA)
+    df_logs["level"] = df_logs["level"].fillna("INFO") # Default level if not explicitly found
+    # Repeated messages (retries, heartbeats) differ only in their timestamp, so store each distinct
+    # message once; .str operations on the categorical then run once per unique message
+    df_logs["message"] = df_logs["message"].str.strip().astype("category")
+    df_logs["raw_line"] = lines
+
+    # Fallback for lines that don't fit regex but contain keywords
+    # This ensures lines with "ERROR" or "WARN" are caught even without a perfect match
+    # Case-insensitive literal scans; no upper-cased copy of every line is materialized
+    error_mask = lines.str.contains("ERROR", case=False, regex=False) & ~df_logs["level"].isin(["ERROR", "CRITICAL", "FATAL"])
+    warn_mask = ~error_mask & lines.str.contains("WARN", case=False, regex=False) & ~df_logs["level"].isin(["WARN", "WARNING"])
+    df_logs.loc[error_mask, "level"] = "ERROR"
+    df_logs.loc[warn_mask, "level"] = "WARN"
+    # One byte code per row instead of a string object, already ordered for plotting
+    df_logs["level"] = df_logs["level"].astype(SEVERITY_CATS)
+
+    # Collect error/warning lines (including CRITICAL/FATAL), deduplicated for the LLM
+    alerts = df_logs[df_logs["level"].isin(["ERROR", "WARN", "WARNING", "CRITICAL", "FATAL"])]
+    line_groups = _collapse_repeated_lines(alerts, max_lines_for_llm)
+
+    return ParsedLogs(df_logs, line_groups)
+
+
+def prepare_timeline_data(df_logs: pd.DataFrame, max_points: int = TIMELINE_MAX_POINTS) -> pd.DataFrame:
+    """
+    Prepares parsed log entries for the events timeline: drops rows without a timestamp
+    and sorts by time. When more than max_points rows remain, INFO/DEBUG rows are collapsed
+    into one point per level per minute so the browser isn't sent every routine line;
+    warnings and more severe events are always kept individually.
+
+    Args:
+        df_logs (pd.DataFrame): Parsed log entries as returned by parse_log_data().
+        max_points (int): Row count above which routine events are aggregated.
+
+    Returns:
+        pd.DataFrame: Rows to plot, with a 'count' column holding the events per point.
+    """
+    # Filter out rows with missing/NaT timestamps as they cannot be plotted on a timeline
+    df_plot = df_logs.dropna(subset=['timestamp']).assign(count=1)
+
+    if len(df_plot) > max_points:
+        is_important = df_plot['level'].isin(['CRITICAL', 'FATAL', 'ERROR', 'WARN', 'WARNING'])
+        background = (
+            df_plot[~is_important]
+            .groupby([pd.Grouper(key='timestamp', freq='1min'), 'level'], observed=True)
+            .agg(count=('raw_line', 'size'), raw_line=('raw_line', 'first'))
+            .reset_index()
+        )
+        background['message'] = background['count'].astype(str) + " " + background['level'].astype(str) + " events in this minute"
+        df_plot = pd.concat([df_plot[is_important], background], ignore_index=True)
+
+    # Sort by timestamp for proper timeline display
+    return df_plot.sort_values(by='timestamp')
+
+
+def parse_uploaded_log(uploaded_file, max_lines_for_llm: int = 200) -> tuple[ParsedLogs | None, str | None]:
+    """
+    Reads an uploaded log file and parses it with parse_log_data().
+
+    Args:
+        uploaded_file (streamlit.runtime.uploaded_file_manager.UploadedFile):
+            The file object uploaded via Streamlit's st.file_uploader.
         max_lines_for_llm (int): Maximum number of log lines to send to the LLM.
 
     Returns:
-        dict: A dictionary containing:
-            'df_logs': Pandas DataFrame with parsed log entries (timestamp, level, message, raw_line).
-            'error_warning_raw_lines': List of raw error/warning strings for LLM.
-    """
-    log_lines = log_content.splitlines()
-    parsed_entries = []
-    raw_error_warning_lines = []
-
-    # Regex for common log patterns: YYYY-MM-DD HH:MM:SS,ms [LEVEL] MESSAGE
-    # This regex is made more flexible for cases where timestamp/level might be missing or vary
-    log_pattern = re.compile(
-        r"^(?P<timestamp_str>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(?:,\d{3})?)?\s*" # Optional timestamp (YYYY-MM-DD HH:MM:SS,ms)
-        r"(?:\[?(?P<level>INFO|WARN|WARNING|ERROR|DEBUG|CRITICAL|FATAL)\]?)?\s*" # Optional Level (e.g., [ERROR] or ERROR)
-        r"(?P<message>.*)" # The rest is the message
+        tuple[ParsedLogs | None, str | None]: The parsed logs and None on success,
+            or None and an error message if the file could not be read or parsed.
+    """
+    if uploaded_file is None:
+        return None, "Please upload a log file to get started."
+
+    try:
+        # getvalue() hands back the upload's buffer as-is; decoding happens inside the parser
+        return parse_log_data(uploaded_file.getvalue(), max_lines_for_llm=max_lines_for_llm), None
+    except UnicodeDecodeError:
+        return None, "Failed to read log file: UnicodeDecodeError. Try a different encoding (e.g., 'latin-1') or ensure it's a plain text file."
+    except Exception as e:
+        return None, f"An unexpected error occurred during log processing: {e}"
+
+
+def _collapsed_lines_appendix(line_groups: list[tuple[str, int, list[str]]]) -> str:
+    """
+    Renders the report appendix listing the raw lines behind each collapsed "[xN]" line
+    (Markdown format), or an empty string when nothing was collapsed.
+    """
+    sections = []
+    for line, count, raw_lines in line_groups:
+        if count == 1:
+            continue # Sent to the model verbatim
+        more = f"\n\n*... and {count - len(raw_lines)} more*" if count > len(raw_lines) else ""
+        raw_block = "\n".join(raw_lines)
+        sections.append(f"### {len(sections) + 1}. {count} similar lines\n\n~~~\n{raw_block}\n~~~{more}")
+    if not sections:
+        return ""
+    return (
+        "\n\n---\n\n## Appendix: Collapsed Log Lines\n\n"
+        "Repeated lines were sent to the model once, prefixed with \"[xN]\". "
+        "The raw lines behind each of them, in log order:\n\n" + "\n\n".join(sections)
     )
 
-    for line in log_lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        match = log_pattern.match(line)
-        
-        timestamp_str = None
-        level = "INFO" # Default level if not explicitly found
-        message = line # Default message is the whole line
-
-        if match:
-            # Extract named groups
-            timestamp_str = match.group('timestamp_str')
-            level_group = match.group('level')
-            message = match.group('message').strip()
-
-            if level_group:
-                level = level_group.upper()
-            
-            # If a timestamp was matched but message is empty, the whole line might be the message
-            if not message and timestamp_str and level_group:
-                message = line[match.end('timestamp_str'):].strip() # Take everything after timestamp
-                if level_group: # If level was also matched, take everything after level
-                    message = line[match.end('level'):].strip()
-
-
-        # Fallback for lines that don't fit regex but contain keywords
-        # This ensures lines with "ERROR" or "WARN" are caught even without a perfect match
-        if "ERROR" in line.upper() and level != "ERROR" and level != "CRITICAL" and level != "FATAL":
-            level = "ERROR"
-        elif ("WARN" in line.upper() or "WARNING" in line.upper()) and level != "WARN" and level != "WARNING":
-            level = "WARN"
-
-        # Create parsed entry for DataFrame
-        parsed_entry = {
-            "timestamp_str": timestamp_str,
-            "level": level,
-            "message": message,
-            "raw_line": line
-        }
-        parsed_entries.append(parsed_entry)
-
-        # Collect raw error/warning lines for LLM (including CRITICAL/FATAL)
-        if level in ["ERROR", "WARN", "WARNING", "CRITICAL", "FATAL"]:
-            if len(raw_error_warning_lines) < max_lines_for_llm:
-                raw_error_warning_lines.append(line)
-
-    df_logs = pd.DataFrame(parsed_entries)
-
-    # Convert timestamp strings to datetime objects, handling potential missing timestamps
-    if 'timestamp_str' in df_logs.columns and not df_logs['timestamp_str'].isnull().all():
-        # Try parsing with milliseconds first, then without
-        df_logs['timestamp'] = pd.to_datetime(df_logs['timestamp_str'], errors='coerce', format='%Y-%m-%d %H:%M:%S,%f')
-        # Fill NaT for timestamps that didn't match with milliseconds format
-        if df_logs['timestamp'].isnull().any():
-            df_logs['timestamp'] = df_logs['timestamp'].fillna(
-                pd.to_datetime(df_logs['timestamp_str'], errors='coerce', format='%Y-%m-%d %H:%M:%S')
-            )
-    else:
-        df_logs['timestamp'] = pd.NaT # Add a NaT column if no timestamps found at all
 
-    return {
-        "df_logs": df_logs, # Return the full DataFrame for plotting
-        "error_warning_raw_lines": raw_error_warning_lines, # For LLM summary
-    }
+def build_download_report(summary_text: str, file_name: str, output_format: str = "markdown",
+                          line_groups: list[tuple[str, int, list[str]]] | None = None) -> tuple[bytes | None, str | None]:
+    """
+    Builds the downloadable report for a generated summary.
 
+    Args:
+        summary_text (str): The generated summary (Markdown format).
+        file_name (str): Name of the analyzed log file, used for the report title.
+        output_format (str): The desired output format ('markdown' or 'html').
+        line_groups (list[tuple[str, int, list[str]]] | None): ParsedLogs.line_groups of the
+            analyzed file; the raw lines behind collapsed lines are appended to the report.
 
-def process_logs_and_summarize(uploaded_file, output_format: str = "markdown") -> tuple[str, str | None, bool, str | None, pd.DataFrame | None]:
+    Returns:
+        tuple[bytes | None, str | None]: The UTF-8 encoded report, ready to pass to
+            st.download_button, and None on success; or None and an error message.
+    """
+    download_filename_prefix = file_name.replace(".log", "").replace(".txt", "")
+    output_content = summary_text + _collapsed_lines_appendix(line_groups or [])
+
+    try:
+        if output_format == "markdown":
+            download_data = output_content.encode("utf-8")
+        elif output_format == "html":
+            with _markdown_lock:
+                html_summary = _MARKDOWN.reset().convert(output_content)
+            html_content = _HTML_REPORT_TEMPLATE.substitute(title=download_filename_prefix, body=html_summary)
+            download_data = html_content.encode("utf-8")
+        else:
+            return None, "Unsupported output format. Only Markdown and HTML are supported for download."
+    except Exception as e:
+        return None, f"An unexpected error occurred during log processing: {e}"
+
+    return download_data, None
+
+
+def _parse_with_timeline(uploaded_file, max_lines_for_llm: int = 200) -> tuple[ParsedLogs | None, str | None]:
+    """
+    parse_uploaded_log(), plus finishing the parsed DataFrame (timestamp parsing) right
+    away, so process_one() can run both steps in a worker thread.
+    """
+    parsed_data, error_message = parse_uploaded_log(uploaded_file, max_lines_for_llm)
+    if parsed_data is not None:
+        parsed_data.df_logs # cached_property; pd.to_datetime over the whole file
+    return parsed_data, error_message
+
+async def process_one(uploaded_file, output_format: str = "markdown") -> tuple[str, bytes | None, bool, str | None, pd.DataFrame | None]:
     """
     Handles an uploaded log file, parses it, generates a summary using LLM,
-    and returns the summary text along with a downloadable link, a success status,
-    an error message, and a DataFrame of parsed logs.
+    and returns the summary text along with the downloadable report, a success status,
+    an error message, and a DataFrame of parsed logs. Parsing and report building run in
+    worker threads so the event loop stays free for other files' Gemini calls.
 
     Args:
         uploaded_file (streamlit.runtime.uploaded_file_manager.UploadedFile):
@@ -115,79 +348,44 @@ def process_logs_and_summarize(uploaded_file, output_format: str = "markdown") -
         output_format (str): The desired output format ('markdown' or 'html').
 
     Returns:
-        tuple[str, str | None, bool, str | None, pd.DataFrame | None]: A tuple containing:
+        tuple[str, bytes | None, bool, str | None, pd.DataFrame | None]: A tuple containing:
             - The generated summary text (Markdown format) if successful, otherwise an empty string.
-            - A base64 encoded download link for the generated summary file (str) or None.
+            - The report file contents (bytes) for st.download_button, or None.
             - A boolean indicating if the operation was successful (True/False).
             - An error message (str) if the operation failed, otherwise None.
             - A Pandas DataFrame of parsed log data, or None if parsing failed.
     """
-    if uploaded_file is None:
-        return "", None, False, "Please upload a log file to get started.", None
+    parsed_data, error_message = await asyncio.to_thread(_parse_with_timeline, uploaded_file, 200)
+    if parsed_data is None:
+        return "", None, False, error_message, None
 
-    log_content = None
-    df_logs = None # Initialize df_logs
-    try:
-        log_content = uploaded_file.read().decode("utf-8")
+    logs_for_llm = "\n".join(parsed_data.llm_log_lines)
 
-        parsed_data = parse_log_data(log_content, max_lines_for_llm=200)
-        df_logs = parsed_data["df_logs"] # Get the DataFrame
-        logs_for_llm = "\n".join(parsed_data["error_warning_raw_lines"])
-        
-        # If no relevant errors/warnings found for LLM, return early with success
-        if not logs_for_llm and not parsed_data["error_warning_raw_lines"]:
-            return "No significant errors or warnings found in the provided log file.", None, True, None, df_logs
+    # If no relevant errors/warnings found for LLM, return early with success
+    if not logs_for_llm:
+        return "No significant errors or warnings found in the provided log file.", None, True, None, parsed_data.df_logs
 
-        summary_text = generate_log_summary(logs_for_llm)
+    summary_text = await generate_log_summary_async(logs_for_llm)
 
-        if not summary_text or summary_text.startswith("ERROR:"):
-            return "", None, False, summary_text, df_logs # Pass df_logs even on LLM error
+    if not summary_text or summary_text.startswith("ERROR:"):
+        return "", None, False, summary_text, parsed_data.df_logs # Pass df_logs even on LLM error
 
-        download_filename_prefix = uploaded_file.name.replace(".log", "").replace(".txt", "")
-        download_link = None
-        mime_type = None
-        output_content = summary_text
+    download_data, error_message = await asyncio.to_thread(
+        build_download_report, summary_text, uploaded_file.name, output_format, parsed_data.line_groups
+    )
+    if error_message:
+        return summary_text, None, False, error_message, parsed_data.df_logs
 
-        if output_format == "markdown":
-            download_filename = f"{download_filename_prefix}_log_summary.md"
-            encoded_content = base64.b64encode(output_content.encode("utf-8")).decode()
-            mime_type = "text/markdown"
-            download_link = f'data:{mime_type};base64,{encoded_content}'
-        elif output_format == "html":
-            html_summary = markdown.markdown(output_content, extensions=['fenced_code', 'tables', 'nl2br'])
-            html_content = f"""
-            <!DOCTYPE html>
-            <html lang="en">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>Log Explanation - {download_filename_prefix}</title>
-                <style>
-                    body {{ font-family: 'Inter', sans-serif; line-height: 1.6; margin: 20px; color: #333; }}
-                    h1, h2, h3, h4, h5, h6 {{ font-family: 'Inter', sans-serif; color: #2E86C1; }}
-                    h2 {{ border-bottom: 1px solid #eee; padding-bottom: 5px; margin-top: 30px; }}
-                    pre {{ background-color: #f4f4f4; padding: 10px; border-radius: 5px; overflow-x: auto; }}
-                    code {{ background-color: #f9f9f9; padding: 2px 4px; border-radius: 3px; font-family: monospace; }}
-                    ul {{ list-style-type: disc; padding-left: 20px; }}
-                    ol {{ padding-left: 20px; }}
-                    ul li, ol li {{ margin-bottom: 5px; }}
-                </style>
-            </head>
-            <body>
-                {html_summary}
-            </body>
-            </html>
-            """
-            download_filename = f"{download_filename_prefix}_log_summary.html"
-            encoded_content = base64.b64encode(html_content.encode("utf-8")).decode()
-            mime_type = "text/html"
-            download_link = f'data:{mime_type};base64,{encoded_content}'
-        else:
-            return summary_text, None, False, "Unsupported output format. Only Markdown and HTML are supported for download.", df_logs
+    return summary_text, download_data, True, None, parsed_data.df_logs # Return df_logs on success
 
-        return summary_text, download_link, True, None, df_logs # Return df_logs on success
+def iter_process_many(uploaded_files, output_format: str = "markdown"):
+    """
+    Analyzes several uploaded files concurrently on the shared event loop, yielding each
+    result as soon as it is ready so the caller can report progress.
 
-    except UnicodeDecodeError:
-        return "", None, False, "Failed to read log file: UnicodeDecodeError. Try a different encoding (e.g., 'latin-1') or ensure it's a plain text file.", df_logs
-    except Exception as e:
-        return "", None, False, f"An unexpected error occurred during log processing: {e}", df_logs
\ No newline at end of file
+    Yields:
+        tuple[int, tuple]: The file's index in uploaded_files and its process_one() result.
+    """
+    futures = {submit_async(process_one(f, output_format)): i for i, f in enumerate(uploaded_files)}
+    for future in concurrent.futures.as_completed(futures):
+        yield futures[future], future.result()
@@ -1,10 +1,129 @@
 import streamlit as st
 import os
+import itertools
 from dotenv import load_dotenv
-from styling import apply_custom_styles
-from features import process_logs_and_summarize
-import pandas as pd # New import for DataFrame
-import plotly.express as px # New import for plotting
+from styling import apply_custom_styles, apply_deferred_styles
+from features import parse_uploaded_log, build_download_report, prepare_timeline_data, iter_process_many, SEVERITY_ORDER
+from ai_logic import stream_log_summary
+import plotly.graph_objects as go # New import for plotting
+
+def _build_empty_timeline(webgl=False):
+    """
+    Builds the timeline figure's invariant chrome (layout, range slider/selector and one
+    styled trace per severity level) with no data, so it can be reused across analyses.
+    With webgl=True the traces render through WebGL (go.Scattergl) instead of SVG.
+    """
+    # Define a color map for better visual distinction of severity
+    color_map = {
+        'CRITICAL': '#DC143C', # Crimson
+        'FATAL': '#8B0000',    # DarkRed
+        'ERROR': '#FF4500',    # OrangeRed
+        'WARN': '#FFD700',     # Gold
+        'WARNING': '#FFA500',  # Orange (used for WARN/WARNING interchangeably)
+        'INFO': '#1E90FF',     # DodgerBlue
+        'DEBUG': '#808080'     # Gray
+    }
+
+    trace_type = go.Scattergl if webgl else go.Scatter
+    fig = go.Figure([
+        trace_type(x=[], y=[], mode='markers', name=level, legendgroup=level, marker=dict(color=color_map[level]))
+        for level in SEVERITY_ORDER
+    ])
+
+    # Customize layout for better readability
+    fig.update_layout(
+        title='Log Events by Severity Over Time',
+        height=550, # Adjust height as needed
+        yaxis_title='Severity Level',
+        xaxis_title='Time',
+        hovermode="x unified", # Shows all hover info for points near the cursor's x-value
+        yaxis=dict(categoryorder='array', categoryarray=SEVERITY_ORDER), # Ensure Y-axis order matches SEVERITY_ORDER
+        legend_title_text='Log Level',
+        font=dict(family="Inter, sans-serif"),
+        title_font_size=20
+    )
+
+    # Add a range slider to the x-axis for easier navigation of time series data
+    fig.update_xaxes(rangeslider_visible=True, rangeselector=dict(
+        buttons=list([
+            dict(count=1, label="1h", step="hour", stepmode="backward"),
+            dict(count=6, label="6h", step="hour", stepmode="backward"),
+            dict(count=1, label="1d", step="day", stepmode="backward"),
+            dict(step="all")
+        ])
+    ))
+    return fig
+
+def render_timeline(df_logs, key=None):
+    """
+    Renders the log events timeline for one analyzed file.
+    """
+    # Check if a valid DataFrame exists and has timestamps for plotting
+    if df_logs is not None and not df_logs.empty and 'timestamp' in df_logs.columns and df_logs['timestamp'].notna().any():
+        st.markdown("---")
+        st.subheader("📊 Log Events Timeline")
+
+        # Timestamped rows only; routine events are aggregated for very large logs
+        df_plot = prepare_timeline_data(df_logs)
+
+        # Like px.scatter's render_mode="auto", only switch to WebGL above 1000 points: browsers cap
+        # live WebGL contexts (~16), and batch mode renders one timeline per file
+        webgl = len(df_plot) > 1000
+
+        # The figure skeleton is built once per session (per trace type); each analysis only swaps in trace data
+        cache_key = 'timeline_fig_webgl' if webgl else 'timeline_fig'
+        if cache_key not in st.session_state:
+            st.session_state[cache_key] = _build_empty_timeline(webgl)
+        fig = st.session_state[cache_key]
+
+        # Show message and raw line in hover, plus the number of events behind each aggregated point
+        hovertemplate = "Time of Event=%{x|%Y-%m-%d %H:%M:%S,%f}<br>Severity Level=%{y}<br>message=%{customdata[0]}<br>raw_line=%{customdata[1]}"
+        if (df_plot['count'] > 1).any():
+            hovertemplate += "<br>count=%{customdata[2]}"
+
+        levels = dict(tuple(df_plot.groupby('level', observed=True)))
+        for trace in fig.data:
+            df_level = levels.get(trace.name)
+            if df_level is None:
+                trace.update(x=[], y=[], customdata=None, showlegend=False)
+            else:
+                trace.update(
+                    x=df_level['timestamp'],
+                    y=df_level['level'].astype(str),
+                    customdata=df_level[['message', 'raw_line', 'count']].to_numpy(),
+                    hovertemplate=hovertemplate + "<extra></extra>",
+                    showlegend=True
+                )
+
+        st.plotly_chart(fig, use_container_width=True, key=key)
+    else:
+        st.info("No sufficient log events with timestamps found to generate a timeline graph.")
+
+def render_download(download_data, file_name, output_format, key="download_log_report_button"):
+    """
+    Renders the download button for one analyzed file's report.
+    """
+    st.markdown("---")
+    st.subheader("⬇️ Download Analysis Report")
+    st.download_button(
+        label=f"Download {output_format.upper()} Report",
+        data=download_data,
+        file_name=file_name.replace(".log", "").replace(".txt", "") + f"_log_summary.{output_format}",
+        mime=f"text/{output_format}",
+        key=key,
+        help=f"Click to download the log analysis report as a .{output_format} file."
+    )
+
+def show_analysis_error(error_message):
+    """
+    Shows why an analysis failed, with a hint for the common causes.
+    """
+    st.error(f"Failed to analyze logs: {error_message}")
+    if "API key" in error_message or "authentication" in error_message or "configure" in error_message:
+        st.warning("Ensure your Google Gemini API key is correctly set in the `.env` file and has sufficient permissions.")
+    elif "UnicodeDecodeError" in error_message:
+        st.info("The log file might be in a different encoding. Try converting it to UTF-8 or ensure it's plain text.")
+    st.info("If the issue persists, check your internet connection or try a different log file.")
 
 def main():
     """
@@ -31,14 +150,16 @@ def main():
     load_dotenv()
     GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
     if not GOOGLE_API_KEY:
+        apply_deferred_styles()
         st.error("🚨 Google Gemini API Key is not set! Please add `GOOGLE_API_KEY=\"YOUR_API_KEY\"` to your `.env` file.")
         st.stop()
 
-    st.sidebar.header("Upload Your Log File")
-    uploaded_file = st.sidebar.file_uploader(
-        "Choose a `.log` or `.txt` file",
+    st.sidebar.header("Upload Your Log Files")
+    uploaded_files = st.sidebar.file_uploader(
+        "Choose `.log` or `.txt` files",
         type=["log", "txt"],
-        help="Upload your server or application log file here."
+        accept_multiple_files=True,
+        help="Upload one or more server or application log files here. Several files are analyzed concurrently."
     )
 
     st.sidebar.header("Output Options")
@@ -51,111 +172,75 @@ def main():
     process_button = st.sidebar.button("Analyze Logs", use_container_width=True, type="primary")
 
     st.markdown("---")
+    apply_deferred_styles() # Alert, expander and metric styles, after the first meaningful paint
 
-    if uploaded_file is not None and process_button:
+    if len(uploaded_files) == 1 and process_button:
+        uploaded_file = uploaded_files[0]
         with st.spinner("Analyzing logs and generating insights... This might take a moment."):
-            # Updated call: now expects a 5th return value (df_logs)
-            summary_text, download_link, success, error_message, df_logs = process_logs_and_summarize(uploaded_file, output_format)
+            parsed_data, error_message = parse_uploaded_log(uploaded_file)
+            success = parsed_data is not None
+            download_data = None
 
             if success:
-                st.success("Log Analysis Complete!")
-                
-                st.subheader("💡 Log Analysis Summary")
-                st.markdown(summary_text) # This renders the structured Markdown output from AI
-
-                # --- NEW GRAPH SECTION ---
-                # Check if a valid DataFrame exists and has timestamps for plotting
-                if df_logs is not None and not df_logs.empty and 'timestamp' in df_logs.columns and df_logs['timestamp'].notna().any():
-                    st.markdown("---")
-                    st.subheader("📊 Log Events Timeline")
-
-                    # Define a consistent order for severity levels for plotting
-                    severity_order = ['CRITICAL', 'FATAL', 'ERROR', 'WARN', 'WARNING', 'INFO', 'DEBUG']
-                    
-                    # Define a color map for better visual distinction of severity
-                    color_map = {
-                        'CRITICAL': '#DC143C', # Crimson
-                        'FATAL': '#8B0000',    # DarkRed
-                        'ERROR': '#FF4500',    # OrangeRed
-                        'WARN': '#FFD700',     # Gold
-                        'WARNING': '#FFA500',  # Orange (used for WARN/WARNING interchangeably)
-                        'INFO': '#1E90FF',     # DodgerBlue
-                        'DEBUG': '#808080'     # Gray
-                    }
-                    
-                    # Filter out rows with missing/NaT timestamps as they cannot be plotted on a timeline
-                    df_plot = df_logs.dropna(subset=['timestamp']).copy()
-                    
-                    # Ensure 'level' column is categorical with the desired order for consistent Y-axis and legend
-                    df_plot['level'] = pd.Categorical(df_plot['level'], categories=severity_order, ordered=True)
-                    
-                    # Sort by timestamp for proper timeline display
-                    df_plot = df_plot.sort_values(by='timestamp')
-
-                    # Create a scatter plot for events over time
-                    fig = px.scatter(
-                        df_plot,
-                        x='timestamp',
-                        y='level', # Y-axis represents the severity level, showing distinct bands for each
-                        color='level',
-                        color_discrete_map=color_map,
-                        hover_data={'message': True, 'raw_line': True, 'timestamp': '|%Y-%m-%d %H:%M:%S,%f'}, # Show message and raw line in hover
-                        title='Log Events by Severity Over Time',
-                        labels={'timestamp': 'Time of Event', 'level': 'Severity Level'},
-                        height=550 # Adjust height as needed
-                    )
-
-                    # Customize layout for better readability
-                    fig.update_layout(
-                        yaxis_title='Severity Level',
-                        xaxis_title='Time',
-                        hovermode="x unified", # Shows all hover info for points near the cursor's x-value
-                        yaxis=dict(categoryorder='array', categoryarray=severity_order), # Ensure Y-axis order matches severity_order
-                        legend_title_text='Log Level',
-                        font=dict(family="Inter, sans-serif"),
-                        title_font_size=20
-                    )
-                    
-                    # Add a range slider to the x-axis for easier navigation of time series data
-                    fig.update_xaxes(rangeslider_visible=True, rangeselector=dict(
-                        buttons=list([
-                            dict(count=1, label="1h", step="hour", stepmode="backward"),
-                            dict(count=6, label="6h", step="hour", stepmode="backward"),
-                            dict(count=1, label="1d", step="day", stepmode="backward"),
-                            dict(step="all")
-                        ])
-                    ))
-
-                    st.plotly_chart(fig, use_container_width=True)
+                logs_for_llm = "\n".join(parsed_data.llm_log_lines)
+                if not logs_for_llm:
+                    summary_stream = iter(["No significant errors or warnings found in the provided log file."])
                 else:
-                    st.info("No sufficient log events with timestamps found to generate a timeline graph.")
-
-                # --- END NEW GRAPH SECTION ---
-
-                st.markdown("---")
-                st.subheader("⬇️ Download Analysis Report")
-                st.download_button(
-                    label=f"Download {output_format.upper()} Report",
-                    data=download_link,
-                    file_name=uploaded_file.name.replace(".log", "").replace(".txt", "") + f"_log_summary.{output_format}",
-                    mime=f"text/{output_format}",
-                    key="download_log_report_button",
-                    help=f"Click to download the log analysis report as a .{output_format} file."
-                )
+                    # Wait for the first chunk only, so errors are caught before anything is rendered
+                    summary_stream = stream_log_summary(logs_for_llm)
+                    first_chunk = next(summary_stream, "")
+                    if not first_chunk or first_chunk.startswith("ERROR:"):
+                        success, error_message = False, first_chunk
+                    summary_stream = itertools.chain([first_chunk], summary_stream)
+
+            if success:
+                status_placeholder = st.empty()
+
+                st.subheader("💡 Log Analysis Summary")
+                summary_text = st.write_stream(summary_stream) # Renders the structured Markdown output from AI as it arrives
+                status_placeholder.success("Log Analysis Complete!")
+
+                if logs_for_llm:
+                    download_data, error_message = build_download_report(summary_text, uploaded_file.name, output_format, parsed_data.line_groups)
+                    if error_message:
+                        st.error(error_message)
+
+                render_timeline(parsed_data.df_logs) # Built on first access, after the LLM call
+
+                if download_data:
+                    render_download(download_data, uploaded_file.name, output_format)
                 
             else:
-                st.error(f"Failed to analyze logs: {error_message}")
-                if "API key" in error_message or "authentication" in error_message or "configure" in error_message:
-                    st.warning("Ensure your Google Gemini API key is correctly set in the `.env` file and has sufficient permissions.")
-                elif "UnicodeDecodeError" in error_message:
-                    st.info("The log file might be in a different encoding. Try converting it to UTF-8 or ensure it's plain text.")
-                st.info("If the issue persists, check your internet connection or try a different log file.")
+                show_analysis_error(error_message)
+
+    elif uploaded_files and process_button:
+        progress_bar = st.progress(0.0, text=f"Analyzing {len(uploaded_files)} log files...")
+        results = [None] * len(uploaded_files)
+        # Files are analyzed concurrently; the bar advances as each one finishes
+        for done, (index, result) in enumerate(iter_process_many(uploaded_files, output_format), start=1):
+            results[index] = result
+            progress_bar.progress(done / len(uploaded_files), text=f"Analyzed {done} of {len(uploaded_files)} log files")
+        progress_bar.empty()
+
+        for index, (uploaded_file, (summary_text, download_data, success, error_message, df_logs)) in enumerate(zip(uploaded_files, results)):
+            st.header(f"📄 {uploaded_file.name}")
+            if not success and not summary_text:
+                show_analysis_error(error_message)
+                continue
+            if error_message:
+                st.error(error_message)
 
+            st.subheader("💡 Log Analysis Summary")
+            st.markdown(summary_text)
+            render_timeline(df_logs, key=f"timeline_{index}")
+            if download_data:
+                render_download(download_data, uploaded_file.name, output_format, key=f"download_log_report_button_{index}")
+            st.markdown("---")
 
-    elif uploaded_file is None and process_button:
+    elif not uploaded_files and process_button:
         st.warning("Please upload a `.log` or `.txt` file first before clicking 'Analyze Logs'.")
         
-    elif uploaded_file is None:
+    elif not uploaded_files:
         st.info("Upload your log file on the left sidebar and click 'Analyze Logs' to get started.")
         st.image("https://images.unsplash.com/photo-1551288259-f2ef4847e06a?crop=entropy&cs=tinysrgb&fit=max&fm=jpg&ixid=M3w1NjY1OTR8MHwxfHNlYXJjaHw3MXx8bG9nfHxlbnwwfHx8fDE3MTk3NDgwODV8MA&ixlib=rb-4.0.3&q=80&w=1080",
                  caption="AI-Powered Log Analysis for System Reliability",
@@ -0,0 +1,94 @@
+import streamlit as st
+from styling import apply_custom_styles, apply_deferred_styles, metric_card_html, HEART_ICON_SVG
+
+# Showcase page for the styles in styling.py, kept out of that module so the app doesn't
+# import it. Run with: streamlit run styling_demo.py
+if __name__ == "__main__":
+    st.set_page_config(layout="wide", page_title="Log Analyzer Styling Showcase")
+    
+    apply_custom_styles() # Apply the new dark-themed styles
+    apply_deferred_styles()
+
+    st.title("Log Analyzer: Professional Dark Theme Demo 📊")
+    st.markdown("""
+    Welcome to the enhanced styling for data engineers and analysts! This theme aims for a
+    **professional, modern, and dark aesthetic**, prioritizing readability and a clean interface.
+    """)
+
+    st.sidebar.header("Navigation & Upload")
+    st.sidebar.markdown("Upload your log files here. 👇")
+    st.sidebar.file_uploader("Upload Log File", type=["txt", "log"])
+    st.sidebar.radio("Analysis Type", ["Summary", "Performance", "Errors"])
+    st.sidebar.button("Analyze Logs")
+
+    st.header("Key Insights & Summary")
+    st.write("""
+    This section will display the summarized insights from your log files.
+    The goal is to provide **actionable intelligence** from vast log data.
+    """)
+
+    st.subheader("Example Log Explanation")
+    st.markdown("""
+    Here's a breakdown of a critical event:
+    * **Timestamp:** `2024-06-25 14:30:15`
+    * **Level:** `ERROR`
+    * **Message:** `Database connection pool exhausted. Max connections reached (100).`
+    * **Recommendation:** `Increase database connection limit or optimize query patterns.`
+
+    This demonstrates how the system identifies key issues like:
+    1.  **Errors:** `Connection refused`
+    2.  **Warnings:** `High memory usage`
+    3.  **Performance Bottlenecks:** `Long query execution`
+    """)
+
+    st.code("""
+# Sample Python Log Snippet
+import logging
+import time
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+def simulate_task(task_id):
+    logging.info(f"Task {task_id}: Starting process.")
+    try:
+        if task_id % 2 == 0:
+            time.sleep(0.1) # Simulate some work
+            logging.warning(f"Task {task_id}: High CPU usage detected during processing.")
+        else:
+            time.sleep(0.05)
+            raise ValueError("Simulated critical error in task processing.")
+    except ValueError as e:
+        logging.error(f"Task {task_id}: Critical error occurred: {e}")
+    logging.info(f"Task {task_id}: Process completed.")
+
+for i in range(5):
+    simulate_task(i)
+    """, language="python")
+
+    st.subheader("Key Metrics")
+    for column, (value, label) in zip(st.columns(3), [("1.2M", "Log entries"), ("37", "Errors"), ("112", "Warnings")]):
+        column.markdown(metric_card_html(value, label), unsafe_allow_html=True)
+
+    st.subheader("System Alerts and Notifications")
+    st.success("Analysis complete! No critical errors detected in the provided logs.")
+    st.warning("Warning: A few 'ResourceNotFound' errors were observed, but the system recovered.")
+    st.error("Fatal Error: Unhandled exception detected. Please review logs immediately for 'NullPointerException'.")
+    st.info("Info: Log analysis initiated successfully. Processing 1.2M log entries.")
+
+    with st.expander("Click here for raw log details (for advanced debugging)"):
+        st.write("""
+        `2024-06-25 14:35:01 INFO MainThread: Starting application server.`
+        `2024-06-25 14:35:05 WARN ConnectionPool: Max connections (50) reached for database 'metrics_db'.`
+        `2024-06-25 14:35:10 ERROR DatabaseError: Could not connect to primary replica.`
+        `2024-06-25 14:35:12 INFO Scheduler: Background job 'report_gen' finished in 1200ms.`
+        """)
+
+    st.markdown("---")
+    st.markdown(
+        f"""
+        <div style="text-align: center; font-size: small; color: var(--text-medium); padding-top: 1rem;">
+            Designed with <span style="color: var(--accent-red);">{HEART_ICON_SVG}</span> by Your Team. Powered by Google Gemini & Streamlit.
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
\ No newline at end of file